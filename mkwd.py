@@ -4,10 +4,12 @@ mkwd - Make Web Development Project
 A CLI tool to scaffold professional web development projects
 
 Usage:
-    mkwd <project_name> [--type=<type>]
+    mkwd <project_name> [--type=<type>] [--parallel] [--dry-run]
 
 Options:
     --type=<type>    Project type: portfolio, api, fullstack [default: portfolio]
+    --parallel       Write files concurrently (helps on slow or network filesystems)
+    --dry-run        List what would be created without touching the filesystem
 
 Examples:
     mkwd my_portfolio
@@ -15,243 +17,28 @@ Examples:
     mkwd my_app --type=fullstack
 """
 
+from __future__ import annotations
+
 import os
 import sys
-from pathlib import Path
-from typing import Dict, List
-import argparse
 
-class ProjectScaffolder:
-    """Generate professional project structures"""
-    
-    def __init__(self, project_name: str, project_type: str = "portfolio"):
-        self.project_name = project_name
-        self.project_type = project_type
-        self.project_root = Path.cwd() / project_name
-        
-    def create(self):
-        """Create the entire project structure"""
-        print(f"🚀 Creating {self.project_type} project: {self.project_name}")
-        
-        if self.project_root.exists():
-            print(f"❌ Error: Directory '{self.project_name}' already exists!")
-            sys.exit(1)
-        
-        # Create structure based on type
-        if self.project_type == "portfolio":
-            self._create_portfolio_structure()
-        elif self.project_type == "api":
-            self._create_api_structure()
-        elif self.project_type == "fullstack":
-            self._create_fullstack_structure()
-        else:
-            print(f"❌ Unknown project type: {self.project_type}")
-            sys.exit(1)
-        
-        print(f"\n✅ Project '{self.project_name}' created successfully!")
-        print(f"\n📂 Location: {self.project_root}")
-        print("\n🎯 Next steps:")
-        print(f"   cd {self.project_name}")
-        print("   python -m venv venv")
-        print("   source venv/bin/activate  # On Windows: venv\\Scripts\\activate")
-        print("   pip install -r requirements.txt")
-        print("   python app/main.py")
-        
-    def _create_portfolio_structure(self):
-        """Create portfolio project structure"""
-        
-        # Define the complete structure
-        structure = {
-            "app": {
-                "__init__.py": self._get_app_init(),
-                "main.py": self._get_main_py(),
-                "config.py": self._get_config_py(),
-                "dependencies.py": "",
-                
-                "api": {
-                    "__init__.py": "",
-                    "routes": {
-                        "__init__.py": "",
-                        "pages.py": self._get_pages_routes(),
-                        "chatbot.py": self._get_chatbot_routes(),
-                        "email.py": self._get_email_routes(),
-                        "contact.py": self._get_contact_routes(),
-                        "analytics.py": self._get_analytics_routes(),
-                    },
-                    "middleware": {
-                        "__init__.py": "",
-                        "analytics.py": self._get_analytics_middleware(),
-                        "security.py": self._get_security_middleware(),
-                        "error.py": "",
-                    }
-                },
-                
-                "core": {
-                    "__init__.py": "",
-                    "graphrag.py": "# Your GraphRAG implementation goes here",
-                    "document_processor.py": "# Your document processor goes here",
-                    "knowledgegraph.py": "# Your knowledge graph goes here",
-                    "queryengine.py": "# Your query engine goes here",
-                    "email_generator.py": "# Your email generator goes here",
-                },
-                
-                "database": {
-                    "__init__.py": "",
-                    "models.py": self._get_models_py(),
-                    "connection.py": self._get_connection_py(),
-                    "crud.py": "# CRUD operations go here",
-                },
-                
-                "utils": {
-                    "__init__.py": "",
-                    "session.py": "",
-                    "validators.py": "",
-                }
-            },
-            
-            "static": {
-                "css": {
-                    "base.css": self._get_base_css(),
-                    "components.css": "",
-                    "utils.css": "",
-                    "pages": {
-                        "home.css": "",
-                        "portfolio.css": "",
-                        "chatbot.css": "",
-                        "contact.css": "",
-                    }
-                },
-                "js": {
-                    "main.js": self._get_main_js(),
-                    "components": {
-                        "navbar.js": "",
-                        "footer.js": "",
-                        "typing-effect.js": "",
-                    },
-                    "pages": {
-                        "chatbot.js": "",
-                        "email.js": "",
-                        "contact.js": "",
-                    }
-                },
-                "img": {
-                    "logo": {},
-                    "projects": {},
-                    "backgrounds": {},
-                }
-            },
-            
-            "templates": {
-                "base.html": self._get_base_template(),
-                "components": {
-                    "navbar.html": self._get_navbar_component(),
-                    "footer.html": self._get_footer_component(),
-                    "project-card.html": "",
-                },
-                "pages": {
-                    "home.html": self._get_home_page(),
-                    "about.html": "",
-                    "portfolio.html": "",
-                    "chatbot.html": "",
-                    "email-generator.html": "",
-                    "project-details": {
-                        "cancer-prediction.html": "",
-                        "cold-email.html": "",
-                        "object-detection.html": "",
-                    }
-                }
-            },
-            
-            "tests": {
-                "__init__.py": "",
-                "test_api.py": "",
-                "test_database.py": "",
-                "test_ml.py": "",
-            },
-            
-            "alembic": {
-                "versions": {},
-                "env.py": "",
-            }
-        }
-        
-        # Create all directories and files
-        self._build_structure(self.project_root, structure)
-        
-        # Create root-level files
-        self._create_file(self.project_root / ".env.example", self._get_env_example())
-        self._create_file(self.project_root / ".gitignore", self._get_gitignore())
-        self._create_file(self.project_root / "requirements.txt", self._get_requirements())
-        self._create_file(self.project_root / "README.md", self._get_readme())
-        self._create_file(self.project_root / "Dockerfile", self._get_dockerfile())
-        self._create_file(self.project_root / "docker-compose.yml", self._get_docker_compose())
-        self._create_file(self.project_root / "run.py", self._get_run_py())
-        
-    def _create_api_structure(self):
-        """Create API-only project structure"""
-        structure = {
-            "app": {
-                "__init__.py": "",
-                "main.py": self._get_main_py(),
-                "config.py": self._get_config_py(),
-                "api": {
-                    "__init__.py": "",
-                    "routes": {
-                        "__init__.py": "",
-                        "users.py": "",
-                        "auth.py": "",
-                    }
-                },
-                "database": {
-                    "__init__.py": "",
-                    "models.py": "",
-                    "connection.py": self._get_connection_py(),
-                }
-            },
-            "tests": {
-                "__init__.py": "",
-                "test_api.py": "",
-            }
-        }
-        
-        self._build_structure(self.project_root, structure)
-        self._create_file(self.project_root / ".env.example", self._get_env_example())
-        self._create_file(self.project_root / ".gitignore", self._get_gitignore())
-        self._create_file(self.project_root / "requirements.txt", self._get_requirements())
-        self._create_file(self.project_root / "README.md", self._get_readme())
-        
-    def _create_fullstack_structure(self):
-        """Create full-stack project with frontend framework"""
-        # Combine portfolio structure with additional frontend tooling
-        self._create_portfolio_structure()
-        
-    def _build_structure(self, base_path: Path, structure: Dict):
-        """Recursively build directory structure"""
-        for name, content in structure.items():
-            path = base_path / name
-            
-            if isinstance(content, dict):
-                # It's a directory
-                path.mkdir(parents=True, exist_ok=True)
-                self._build_structure(path, content)
-            else:
-                # It's a file
-                path.parent.mkdir(parents=True, exist_ok=True)
-                self._create_file(path, content)
-    
-    def _create_file(self, filepath: Path, content: str):
-        """Create a file with content"""
-        with open(filepath, 'w') as f:
-            f.write(content)
-        print(f"  ✓ Created: {filepath.relative_to(self.project_root)}")
-    
-    # ========== TEMPLATE CONTENT METHODS ==========
-    
-    def _get_app_init(self):
-        return '"""Portfolio Application Package"""\n__version__ = "1.0.0"\n'
-    
-    def _get_main_py(self):
-        return '''"""
+
+def _write_file(filepath: str, content: bytes):
+    """Write pre-encoded content to filepath with a single os.write call"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Placeholder files are empty; opening with O_CREAT is enough
+        if content:
+            os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+# ========== TEMPLATE CONTENT ==========
+
+_TEMPLATE_APP_INIT = b'"""Portfolio Application Package"""\n__version__ = "1.0.0"\n'
+
+_TEMPLATE_MAIN_PY = '''"""
 Main FastAPI Application
 """
 from fastapi import FastAPI
@@ -316,10 +103,9 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8080, reload=settings.DEBUG)
-'''
-    
-    def _get_config_py(self):
-        return '''"""Configuration Management"""
+'''.encode()
+
+_TEMPLATE_CONFIG_PY = b'''"""Configuration Management"""
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -343,9 +129,8 @@ class Settings(BaseSettings):
 
 settings = Settings()
 '''
-    
-    def _get_models_py(self):
-        return '''"""Database Models"""
+
+_TEMPLATE_MODELS_PY = b'''"""Database Models"""
 from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -379,9 +164,8 @@ class Visitor(Base):
     page = Column(String(200))
     timestamp = Column(DateTime, default=func.now())
 '''
-    
-    def _get_connection_py(self):
-        return '''"""Database Connection"""
+
+_TEMPLATE_CONNECTION_PY = '''"""Database Connection"""
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
@@ -411,10 +195,9 @@ def init_db():
     from app.database.models import Base
     Base.metadata.create_all(bind=engine)
     print("✅ Database initialized")
-'''
-    
-    def _get_pages_routes(self):
-        return '''"""Page Routes"""
+'''.encode()
+
+_TEMPLATE_PAGES_ROUTES = b'''"""Page Routes"""
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
@@ -429,9 +212,8 @@ async def home(request: Request):
         "title": "Home"
     })
 '''
-    
-    def _get_chatbot_routes(self):
-        return '''"""Chatbot Routes"""
+
+_TEMPLATE_CHATBOT_ROUTES = b'''"""Chatbot Routes"""
 from fastapi import APIRouter
 
 router = APIRouter()
@@ -444,9 +226,8 @@ async def upload_pdf():
 async def query_pdf():
     return {"message": "Query endpoint - implement your logic here"}
 '''
-    
-    def _get_email_routes(self):
-        return '''"""Email Generator Routes"""
+
+_TEMPLATE_EMAIL_ROUTES = b'''"""Email Generator Routes"""
 from fastapi import APIRouter
 
 router = APIRouter()
@@ -455,9 +236,8 @@ router = APIRouter()
 async def generate_email():
     return {"message": "Email generation - implement your logic here"}
 '''
-    
-    def _get_contact_routes(self):
-        return '''"""Contact Form Routes"""
+
+_TEMPLATE_CONTACT_ROUTES = b'''"""Contact Form Routes"""
 from fastapi import APIRouter, Request, Body
 from app.database.models import ContactMessage
 from app.database.connection import get_db
@@ -475,9 +255,8 @@ async def submit_contact(request: Request, payload: dict = Body(...)):
         db.add(msg)
     return {"status": "success"}
 '''
-    
-    def _get_analytics_routes(self):
-        return '''"""Analytics Routes"""
+
+_TEMPLATE_ANALYTICS_ROUTES = b'''"""Analytics Routes"""
 from fastapi import APIRouter
 
 router = APIRouter()
@@ -486,9 +265,8 @@ router = APIRouter()
 async def get_analytics():
     return {"message": "Analytics - implement your logic here"}
 '''
-    
-    def _get_analytics_middleware(self):
-        return '''"""Analytics Middleware"""
+
+_TEMPLATE_ANALYTICS_MIDDLEWARE = b'''"""Analytics Middleware"""
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.database.models import Visitor
 from app.database.connection import get_db
@@ -509,9 +287,8 @@ class AnalyticsMiddleware(BaseHTTPMiddleware):
         
         return response
 '''
-    
-    def _get_security_middleware(self):
-        return '''"""Security Headers Middleware"""
+
+_TEMPLATE_SECURITY_MIDDLEWARE = b'''"""Security Headers Middleware"""
 from starlette.middleware.base import BaseHTTPMiddleware
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -522,9 +299,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-XSS-Protection"] = "1; mode=block"
         return response
 '''
-    
-    def _get_base_css(self):
-        return '''/* Base Styles */
+
+_TEMPLATE_BASE_CSS = b'''/* Base Styles */
 * {
     margin: 0;
     padding: 0;
@@ -552,16 +328,14 @@ body {
     padding: 0 20px;
 }
 '''
-    
-    def _get_main_js(self):
-        return '''// Main JavaScript
+
+_TEMPLATE_MAIN_JS = b'''// Main JavaScript
 console.log('Portfolio loaded!');
 
 // Add your global JavaScript here
 '''
-    
-    def _get_base_template(self):
-        return '''<!DOCTYPE html>
+
+_TEMPLATE_BASE_TEMPLATE = b'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -586,9 +360,8 @@ console.log('Portfolio loaded!');
 </body>
 </html>
 '''
-    
-    def _get_navbar_component(self):
-        return '''<nav class="navbar">
+
+_TEMPLATE_NAVBAR_COMPONENT = b'''<nav class="navbar">
     <div class="container">
         <div class="logo">MyPortfolio</div>
         <ul class="nav-links">
@@ -600,17 +373,15 @@ console.log('Portfolio loaded!');
     </div>
 </nav>
 '''
-    
-    def _get_footer_component(self):
-        return '''<footer class="footer">
+
+_TEMPLATE_FOOTER_COMPONENT = b'''<footer class="footer">
     <div class="container">
         <p>&copy; 2024 MyPortfolio. All rights reserved.</p>
     </div>
 </footer>
 '''
-    
-    def _get_home_page(self):
-        return '''{% extends "base.html" %}
+
+_TEMPLATE_HOME_PAGE = b'''{% extends "base.html" %}
 
 {% block content %}
 <div class="hero">
@@ -621,9 +392,8 @@ console.log('Portfolio loaded!');
 </div>
 {% endblock %}
 '''
-    
-    def _get_env_example(self):
-        return '''# Application
+
+_TEMPLATE_ENV_EXAMPLE = b'''# Application
 PROJECT_NAME="My Portfolio"
 ENVIRONMENT=development
 DEBUG=true
@@ -644,9 +414,8 @@ WEBHOOK_URL=
 # CORS
 ALLOWED_ORIGINS=http://localhost:8080
 '''
-    
-    def _get_gitignore(self):
-        return '''# Python
+
+_TEMPLATE_GITIGNORE = b'''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -686,9 +455,8 @@ Thumbs.db
 .cache/
 .pytest_cache/
 '''
-    
-    def _get_requirements(self):
-        return '''# Core
+
+_TEMPLATE_REQUIREMENTS = b'''# Core
 fastapi==0.109.0
 uvicorn[standard]==0.27.0
 python-multipart==0.0.6
@@ -708,9 +476,100 @@ requests==2.31.0
 pytest==7.4.4
 pytest-asyncio==0.23.3
 '''
-    
-    def _get_readme(self):
-        return f'''# {self.project_name}
+
+_TEMPLATE_DOCKERFILE = b'''FROM python:3.11-slim
+
+WORKDIR /app
+
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+COPY . .
+
+EXPOSE 8080
+
+CMD ["python", "app/main.py"]
+'''
+
+_TEMPLATE_DOCKER_COMPOSE = b'''version: '3.8'
+
+services:
+  app:
+    build: .
+    ports:
+      - "8080:8080"
+    environment:
+      - DATABASE_URL=sqlite:///./app.db
+    volumes:
+      - .:/app
+'''
+
+_TEMPLATE_RUN_PY = b'''"""Development server runner"""
+import uvicorn
+from app.config import settings
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8080,
+        reload=settings.DEBUG,
+        log_level="info"
+    )
+'''
+
+_TEMPLATE_FRONTEND_PACKAGE_JSON = b'''{
+  "name": "frontend",
+  "private": true,
+  "version": "0.1.0",
+  "type": "module",
+  "scripts": {
+    "dev": "vite",
+    "build": "vite build",
+    "preview": "vite preview"
+  },
+  "devDependencies": {
+    "vite": "^5.0.0"
+  }
+}
+'''
+
+_TEMPLATE_FRONTEND_VITE_CONFIG = b'''import { defineConfig } from 'vite';
+
+export default defineConfig({
+  server: {
+    proxy: {
+      '/api': 'http://localhost:8080',
+    },
+  },
+  build: {
+    outDir: '../static/dist',
+    emptyOutDir: true,
+  },
+});
+'''
+
+_TEMPLATE_FRONTEND_INDEX_HTML = b'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Frontend</title>
+</head>
+<body>
+    <div id="app"></div>
+    <script type="module" src="/src/main.js"></script>
+</body>
+</html>
+'''
+
+_TEMPLATE_FRONTEND_MAIN_JS = b'''// Frontend entry point
+document.querySelector('#app').textContent = 'Frontend loaded!';
+
+// Mount your components here
+'''
+
+_README_TEMPLATE = '''# {name}
 
 Professional web application built with FastAPI.
 
@@ -743,7 +602,7 @@ Visit: http://localhost:8080
 ## Project Structure
 
 ```
-{self.project_name}/
+{name}/
 ├── app/           # Application code
 ├── static/        # Static assets
 ├── templates/     # HTML templates
@@ -765,52 +624,342 @@ alembic revision --autogenerate -m "description"
 alembic upgrade head
 ```
 '''
-    
-    def _get_dockerfile(self):
-        return '''FROM python:3.11-slim
 
-WORKDIR /app
 
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+# ========== PROJECT STRUCTURES ==========
 
-COPY . .
+_PORTFOLIO_STRUCTURE = {
+    "app": {
+        "__init__.py": _TEMPLATE_APP_INIT,
+        "main.py": _TEMPLATE_MAIN_PY,
+        "config.py": _TEMPLATE_CONFIG_PY,
+        "dependencies.py": b"",
+        
+        "api": {
+            "__init__.py": b"",
+            "routes": {
+                "__init__.py": b"",
+                "pages.py": _TEMPLATE_PAGES_ROUTES,
+                "chatbot.py": _TEMPLATE_CHATBOT_ROUTES,
+                "email.py": _TEMPLATE_EMAIL_ROUTES,
+                "contact.py": _TEMPLATE_CONTACT_ROUTES,
+                "analytics.py": _TEMPLATE_ANALYTICS_ROUTES,
+            },
+            "middleware": {
+                "__init__.py": b"",
+                "analytics.py": _TEMPLATE_ANALYTICS_MIDDLEWARE,
+                "security.py": _TEMPLATE_SECURITY_MIDDLEWARE,
+                "error.py": b"",
+            }
+        },
+        
+        "core": {
+            "__init__.py": b"",
+            "graphrag.py": b"# Your GraphRAG implementation goes here",
+            "document_processor.py": b"# Your document processor goes here",
+            "knowledgegraph.py": b"# Your knowledge graph goes here",
+            "queryengine.py": b"# Your query engine goes here",
+            "email_generator.py": b"# Your email generator goes here",
+        },
+        
+        "database": {
+            "__init__.py": b"",
+            "models.py": _TEMPLATE_MODELS_PY,
+            "connection.py": _TEMPLATE_CONNECTION_PY,
+            "crud.py": b"# CRUD operations go here",
+        },
+        
+        "utils": {
+            "__init__.py": b"",
+            "session.py": b"",
+            "validators.py": b"",
+        }
+    },
+    
+    "static": {
+        "css": {
+            "base.css": _TEMPLATE_BASE_CSS,
+            "components.css": b"",
+            "utils.css": b"",
+            "pages": {
+                "home.css": b"",
+                "portfolio.css": b"",
+                "chatbot.css": b"",
+                "contact.css": b"",
+            }
+        },
+        "js": {
+            "main.js": _TEMPLATE_MAIN_JS,
+            "components": {
+                "navbar.js": b"",
+                "footer.js": b"",
+                "typing-effect.js": b"",
+            },
+            "pages": {
+                "chatbot.js": b"",
+                "email.js": b"",
+                "contact.js": b"",
+            }
+        },
+        "img": {
+            "logo": {},
+            "projects": {},
+            "backgrounds": {},
+        }
+    },
+    
+    "templates": {
+        "base.html": _TEMPLATE_BASE_TEMPLATE,
+        "components": {
+            "navbar.html": _TEMPLATE_NAVBAR_COMPONENT,
+            "footer.html": _TEMPLATE_FOOTER_COMPONENT,
+            "project-card.html": b"",
+        },
+        "pages": {
+            "home.html": _TEMPLATE_HOME_PAGE,
+            "about.html": b"",
+            "portfolio.html": b"",
+            "chatbot.html": b"",
+            "email-generator.html": b"",
+            "project-details": {
+                "cancer-prediction.html": b"",
+                "cold-email.html": b"",
+                "object-detection.html": b"",
+            }
+        }
+    },
+    
+    "tests": {
+        "__init__.py": b"",
+        "test_api.py": b"",
+        "test_database.py": b"",
+        "test_ml.py": b"",
+    },
+    
+    "alembic": {
+        "versions": {},
+        "env.py": b"",
+    },
+    
+    # Root-level files (README.md is added per project, see _get_readme)
+    ".env.example": _TEMPLATE_ENV_EXAMPLE,
+    ".gitignore": _TEMPLATE_GITIGNORE,
+    "requirements.txt": _TEMPLATE_REQUIREMENTS,
+    "Dockerfile": _TEMPLATE_DOCKERFILE,
+    "docker-compose.yml": _TEMPLATE_DOCKER_COMPOSE,
+    "run.py": _TEMPLATE_RUN_PY,
+}
 
-EXPOSE 8080
+_API_STRUCTURE = {
+    "app": {
+        "__init__.py": b"",
+        "main.py": _TEMPLATE_MAIN_PY,
+        "config.py": _TEMPLATE_CONFIG_PY,
+        "api": {
+            "__init__.py": b"",
+            "routes": {
+                "__init__.py": b"",
+                "users.py": b"",
+                "auth.py": b"",
+            }
+        },
+        "database": {
+            "__init__.py": b"",
+            "models.py": b"",
+            "connection.py": _TEMPLATE_CONNECTION_PY,
+        }
+    },
+    "tests": {
+        "__init__.py": b"",
+        "test_api.py": b"",
+    },
+    ".env.example": _TEMPLATE_ENV_EXAMPLE,
+    ".gitignore": _TEMPLATE_GITIGNORE,
+    "requirements.txt": _TEMPLATE_REQUIREMENTS,
+}
 
-CMD ["python", "app/main.py"]
-'''
-    
-    def _get_docker_compose(self):
-        return '''version: '3.8'
+_FULLSTACK_STRUCTURE = {
+    **_PORTFOLIO_STRUCTURE,
+    "frontend": {
+        "package.json": _TEMPLATE_FRONTEND_PACKAGE_JSON,
+        "vite.config.js": _TEMPLATE_FRONTEND_VITE_CONFIG,
+        "index.html": _TEMPLATE_FRONTEND_INDEX_HTML,
+        "src": {
+            "main.js": _TEMPLATE_FRONTEND_MAIN_JS,
+            "components": {},
+        },
+    },
+}
 
-services:
-  app:
-    build: .
-    ports:
-      - "8080:8080"
-    environment:
-      - DATABASE_URL=sqlite:///./app.db
-    volumes:
-      - .:/app
-'''
+
+def _flatten_layout(structure: dict) -> dict:
+    """Flatten a nested structure into relative "dirs", "all_dirs" and "files" tuples"""
+    dirs = []
+    files = []
+    # Iterative depth-first walk; each entry resumes its directory's items
+    stack = [("", iter(structure.items()))]
+    while stack:
+        base, items = stack[-1]
+        for name, content in items:
+            path = os.path.join(base, name)
+            
+            if isinstance(content, dict):
+                dirs.append(path)
+                stack.append((path, iter(content.items())))
+                break
+            files.append((path, content))
+        else:
+            stack.pop()
+    # "dirs" keeps only leaf directories, since makedirs creates their
+    # ancestors; "all_dirs" is the full list for reporting
+    parents = {os.path.dirname(path) for path in dirs}
+    leaves = tuple(path for path in dirs if path not in parents)
+    return {"dirs": leaves, "all_dirs": tuple(dirs), "files": tuple(files)}
+
+
+_PORTFOLIO_LAYOUT = _flatten_layout(_PORTFOLIO_STRUCTURE)
+_API_LAYOUT = _flatten_layout(_API_STRUCTURE)
+_FULLSTACK_LAYOUT = _flatten_layout(_FULLSTACK_STRUCTURE)
+
+
+class ProjectScaffolder:
+    """Generate professional project structures"""
     
-    def _get_run_py(self):
-        return '''"""Development server runner"""
-import uvicorn
-from app.config import settings
+    def __init__(self, project_name: str, project_type: str = "portfolio",
+                 parallel: bool = False, dry_run: bool = False):
+        from pathlib import Path
+        
+        self.project_name = project_name
+        self.project_type = project_type
+        self.parallel = parallel
+        self.dry_run = dry_run
+        self.project_root = Path.cwd() / project_name
+        # Prepended to the layouts' relative paths
+        self._root_str = str(self.project_root) + os.sep
+        self._created: list[str] = []
+        
+    def create(self):
+        """Create the entire project structure"""
+        print(f"🚀 Creating {self.project_type} project: {self.project_name}")
+        
+        # Create structure based on type
+        builders = {
+            "portfolio": self._create_portfolio_structure,
+            "api": self._create_api_structure,
+            "fullstack": self._create_fullstack_structure,
+        }
+        if self.project_type not in builders:
+            raise SystemExit(f"❌ Unknown project type: {self.project_type}")
+        
+        if self.dry_run:
+            root_exists = os.path.exists(self.project_root)
+        else:
+            # A single makedirs both creates the root (and any missing
+            # parents) and detects an existing one
+            try:
+                os.makedirs(self.project_root)
+                root_exists = False
+            except FileExistsError:
+                root_exists = True
+        if root_exists:
+            raise SystemExit(f"❌ Error: Directory '{self.project_name}' already exists!")
+        
+        builders[self.project_type]()
+        
+        if self._created:
+            label = "Would create" if self.dry_run else "Created"
+            sys.stdout.write("".join(f"  ✓ {label}: {rel}\n" for rel in self._created))
+        
+        if self.dry_run:
+            print(f"\n🔍 Dry run: nothing was written for '{self.project_name}'")
+            return
+        
+        sys.stdout.write(f"""
+✅ Project '{self.project_name}' created successfully!
+
+📂 Location: {self.project_root}
+
+🎯 Next steps:
+   cd {self.project_name}
+   python -m venv venv
+   source venv/bin/activate  # On Windows: venv\\Scripts\\activate
+   pip install -r requirements.txt
+   python app/main.py
+""")
+        
+    def _create_portfolio_structure(self):
+        """Create portfolio project structure"""
+        # Create all directories and files from the shared layout
+        self._build_structure(_PORTFOLIO_LAYOUT, self._project_files())
+        
+    def _create_api_structure(self):
+        """Create API-only project structure"""
+        self._build_structure(_API_LAYOUT, self._project_files())
+        
+    def _create_fullstack_structure(self):
+        """Create full-stack project with frontend framework"""
+        # Portfolio structure plus frontend tooling, built in a single pass
+        self._build_structure(_FULLSTACK_LAYOUT, self._project_files())
+        
+    def _project_files(self) -> tuple:
+        """Root-level files that depend on the project name"""
+        return (("README.md", self._get_readme()),)
+        
+    def _build_structure(self, layout: dict, extra_files: tuple = ()):
+        """Create the layout's leaf directories, then write its files"""
+        files = layout["files"] + extra_files
+        if self.dry_run:
+            # Only record the layout; directories get a trailing separator
+            entries = [path + os.sep for path in layout["all_dirs"]]
+            entries.extend(path for path, _ in files)
+            self._created.extend(sorted(entries))
+            return
+        
+        root = self._root_str
+        for path in layout["dirs"]:
+            os.makedirs(root + path, exist_ok=True)
+        
+        if self.parallel:
+            self._write_files_parallel(files)
+        else:
+            for path, content in files:
+                self._create_file(path, content)
+    
+    def _write_files_parallel(self, files: tuple[tuple[str, bytes], ...]):
+        """Write files concurrently once their directories exist"""
+        import asyncio
+        
+        root = self._root_str
+        
+        async def write_all():
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[
+                loop.run_in_executor(None, _write_file, root + path, content)
+                for path, content in files
+            ])
+        
+        asyncio.run(write_all())
+        self._created.extend(path for path, _ in files)
+    
+    def _create_file(self, relpath: str, content: bytes):
+        """Create a file, given its path relative to the project root"""
+        _write_file(self._root_str + relpath, content)
+        self._created.append(relpath)
+    
+    # ========== TEMPLATE CONTENT METHODS ==========
+    
+    def _get_readme(self):
+        return _README_TEMPLATE.format(name=self.project_name).encode()
 
-if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8080,
-        reload=settings.DEBUG,
-        log_level="info"
-    )
-'''
 
 def main():
+    # Fast path for the common `mkwd <project_name>` call: skip argparse entirely
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        ProjectScaffolder(sys.argv[1], "portfolio").create()
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Make Web Development Project - Scaffold professional web projects"
     )
@@ -821,10 +970,22 @@ def main():
         default="portfolio",
         help="Type of project to create (default: portfolio)"
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Write files concurrently (helps on slow or network filesystems)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the files and directories that would be created without writing them"
+    )
     
     args = parser.parse_args()
     
-    scaffolder = ProjectScaffolder(args.project_name, args.type)
+    scaffolder = ProjectScaffolder(
+        args.project_name, args.type, parallel=args.parallel, dry_run=args.dry_run
+    )
     scaffolder.create()
 
 
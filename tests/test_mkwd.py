@@ -0,0 +1,107 @@
+"""Tests for the mkwd scaffolder
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from mkwd import ProjectScaffolder
+
+PROJECT_TYPES = ("portfolio", "api", "fullstack")
+
+
+def _snapshot(root: str) -> dict:
+    """Map every relative path under root to its bytes (None for directories)"""
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames:
+            tree[os.path.relpath(os.path.join(dirpath, name), root) + os.sep] = None
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                tree[os.path.relpath(path, root)] = f.read()
+    return tree
+
+
+class ScaffolderTestCase(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _scaffold(self, name: str, project_type: str, cwd: str = ".",
+                  **kwargs) -> ProjectScaffolder:
+        """Scaffold name inside cwd, which is created if needed"""
+        os.makedirs(cwd, exist_ok=True)
+        os.chdir(cwd)
+        try:
+            scaffolder = ProjectScaffolder(name, project_type, **kwargs)
+            with redirect_stdout(io.StringIO()):
+                scaffolder.create()
+        finally:
+            os.chdir(self._tmp.name)
+        return scaffolder
+
+
+class TestDryRun(ScaffolderTestCase):
+    def test_dry_run_writes_nothing(self):
+        for project_type in PROJECT_TYPES:
+            with self.subTest(project_type=project_type):
+                self._scaffold("dry", project_type, dry_run=True)
+                self.assertEqual(os.listdir("."), [])
+
+    def test_dry_run_lists_what_a_real_run_creates(self):
+        for project_type in PROJECT_TYPES:
+            with self.subTest(project_type=project_type):
+                dry = self._scaffold(f"dry_{project_type}", project_type, dry_run=True)
+                self._scaffold(f"real_{project_type}", project_type)
+                created = _snapshot(f"real_{project_type}")
+                self.assertEqual(sorted(dry._created), sorted(created))
+
+
+class TestParallel(ScaffolderTestCase):
+    def test_parallel_matches_serial(self):
+        for project_type in PROJECT_TYPES:
+            with self.subTest(project_type=project_type):
+                # Same project name in both, so the README content matches
+                self._scaffold("proj", project_type, cwd=f"serial_{project_type}")
+                self._scaffold("proj", project_type, cwd=f"parallel_{project_type}",
+                               parallel=True)
+                self.assertEqual(
+                    _snapshot(os.path.join(f"parallel_{project_type}", "proj")),
+                    _snapshot(os.path.join(f"serial_{project_type}", "proj")),
+                )
+
+    def test_parallel_creates_empty_directories(self):
+        self._scaffold("proj", "fullstack", parallel=True)
+        for path in ("static/img/logo", "static/img/projects",
+                     "static/img/backgrounds", "alembic/versions",
+                     "frontend/src/components"):
+            with self.subTest(path=path):
+                full = os.path.join("proj", path)
+                self.assertTrue(os.path.isdir(full))
+                self.assertEqual(os.listdir(full), [])
+
+
+class TestCreate(ScaffolderTestCase):
+    def test_missing_parent_directories_are_created(self):
+        self._scaffold(os.path.join("a", "b"), "api")
+        self.assertTrue(os.path.isfile(os.path.join("a", "b", "README.md")))
+
+    def test_existing_directory_is_an_error(self):
+        os.mkdir("taken")
+        with self.assertRaises(SystemExit):
+            self._scaffold("taken", "portfolio")
+
+
+if __name__ == "__main__":
+    unittest.main()